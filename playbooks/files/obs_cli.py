@@ -132,32 +132,41 @@ def get_instances_info(tf_state_file):
     return {name: tf_state['outputs'][name]['value'] for name in tf_state['outputs']}
 
 
-def main():
-    """
-    Script to prepare key and state variables
-    Creates var file for ansible in playbooks/vars folder
+def sync_scenarios(key_name, scenarios, terraform_workspace, output):
+    """Download controller key and scenario states, generate vars files
+
+    Returns path of downloaded key
     """
-    args = parse_params()
-    if not os.path.exists(args.output):
-        os.makedirs(args.output)
-    key_file = f'{args.output}/{args.key_name}'
+    if not os.path.exists(output):
+        os.makedirs(output)
+    key_file = f'{output}/{key_name}'
     credential = acquire_temporary_ak_sk()
     key_file = get_item_from_s3(
         key_file,
-        f'key/{args.key_name}',
+        f'key/{key_name}',
         credential)
     os.chmod(key_file, RW_OWNER)
 
-    for state in args.scenario_name:
-        path = f'{args.output}/{state}'
+    for state in scenarios:
+        path = f'{output}/{state}'
         get_item_from_s3(
             path,
-            f'env:/{args.terraform_workspace}/terraform_state/{state}',
+            f'env:/{terraform_workspace}/terraform_state/{state}',
             credential)
         generate_vars_file(
             path,
             key_file
         )
+    return key_file
+
+
+def main():
+    """
+    Script to prepare key and state variables
+    Creates var file for ansible in playbooks/vars folder
+    """
+    args = parse_params()
+    sync_scenarios(args.key_name, args.scenario_name, args.terraform_workspace, args.output)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+import datetime
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+
+from obs_cli import sync_scenarios
+
+PLAYBOOKS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROOT_DIR = os.path.dirname(PLAYBOOKS_DIR)
+PREPARE_PLAYBOOK = 'prepare_variables.yaml'
+
+SUCCESS_METRIC = 'csm_scenario_timings'
+FAILED_METRIC = 'csm_scenario_failed'
+
+
+def parse_params():
+    parser = ArgumentParser(description='Prepare variables once and run scenarios concurrently')
+    parser.add_argument('--key_name', '-k', default='key_csm_controller')
+    parser.add_argument('--playbook', '-p', nargs='+', required=True,
+                        help='Scenario playbook names, e.g. as_monitoring dns_monitoring')
+    parser.add_argument('--terraform_workspace', '-w', default='temp')
+    parser.add_argument('--output', '-o', default='/tmp/data')
+    parser.add_argument('--workers', '-n', type=int, default=4)
+    parser.add_argument('--socket', default=os.getenv('APIMON_PROFILER_MESSAGE_SOCKET', ''))
+    args = parser.parse_args()
+    return args
+
+
+def scenario_states(playbook):
+    """Get names of states imported by scenario playbook from OBS"""
+    with open(f'{PLAYBOOKS_DIR}/{playbook}.yaml') as pb_file:
+        plays = yaml.safe_load(pb_file)
+    for play in plays:
+        if play.get('import_playbook') == PREPARE_PLAYBOOK:
+            return play['vars']['scenario_name'].split()
+    return []
+
+
+def run_playbook(playbook, args):
+    """Run scenario playbook skipping variables preparation, return (playbook, seconds, rc)"""
+    command = [
+        'ansible-playbook', f'{PLAYBOOKS_DIR}/{playbook}.yaml',
+        '-e', 'skip_prepare=true',
+        '-e', f'key_name={args.key_name}',
+        '-e', f'key_path={args.output}',
+        '-e', f'terraform_workspace={args.terraform_workspace}',
+    ]
+    started = time.monotonic()
+    result = subprocess.run(command, cwd=ROOT_DIR, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, universal_newlines=True)
+    elapsed = time.monotonic() - started
+    print(f'{playbook} finished with code {result.returncode} in {elapsed:.1f}s')
+    if result.returncode:
+        print(result.stdout)
+    return playbook, elapsed, result.returncode
+
+
+def push_metric(data, message_socket_address):
+    """push metrics to socket"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as _socket:
+        _socket.connect(message_socket_address)
+        msg = '%s\n' % json.dumps(data, separators=(',', ':'))
+        _socket.sendall(msg.encode('utf8'))
+
+
+def create_metric(name, value, metric_type):
+    """Creates statsd type metric in the same format as MessageModule"""
+    return {
+        'name': name,
+        'value': value,
+        'environment': None,
+        'zone': None,
+        'metric_type': metric_type,
+        'az': 'default',
+        'timestamp': datetime.datetime.now().isoformat(),
+        '__type': 'metric'
+    }
+
+
+def timing_metrics(playbook, elapsed, returncode):
+    metrics = [create_metric(
+        name=f'{SUCCESS_METRIC}.{playbook}',
+        value=int(elapsed * 1000),
+        metric_type='ms'
+    )]
+    if returncode:
+        metrics.append(create_metric(
+            name=f'{FAILED_METRIC}.{playbook}.failed',
+            value=1,
+            metric_type='c'
+        ))
+    return metrics
+
+
+def main():
+    """
+    Script to run several scenarios at once
+    Key and states of all scenarios are synchronized with OBS only once,
+    then scenario playbooks are started concurrently
+    """
+    args = parse_params()
+    states = []
+    for playbook in args.playbook:
+        states.extend(s for s in scenario_states(playbook) if s not in states)
+    os.chdir(PLAYBOOKS_DIR)
+    sync_scenarios(args.key_name, states, args.terraform_workspace, args.output)
+
+    failed = False
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        results = executor.map(lambda pb: run_playbook(pb, args), args.playbook)
+        for playbook, elapsed, returncode in results:
+            failed = failed or bool(returncode)
+            if not args.socket:
+                continue
+            try:
+                for metric in timing_metrics(playbook, elapsed, returncode):
+                    push_metric(metric, args.socket)
+            except OSError as err:
+                print(f'Failed to push {playbook} metrics: {err}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,280 @@
+#!/usr/bin/python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import contextlib
+import random
+import select
+import socket
+import struct
+import time
+
+from ansible.module_utils.message import MessageModule
+
+DOCUMENTATION = '''
+---
+module: dns_resolve_monitoring
+short_description: DNS resolution response times.
+version_added: "1.0.0"
+author: "Anton Sidelnikov (@anton-sidelnikov)"
+description:
+  - Resolve list of records using list of resolvers and push metrics to unix socket server
+  - Queries are sent in batches over single UDP socket per address family
+    and matched by query ID.
+  - Answers with response code other than NOERROR and NXDOMAIN are counted as failures.
+  - APIMON_PROFILER_MESSAGE_SOCKET environment variable should be set.
+options:
+  record_names:
+    description: Names of the records to be resolved.
+    type: list
+    elements: str
+    required: true
+  resolvers:
+    description: IPv4/IPv6 addresses or host names of the DNS servers to be queried.
+    type: list
+    elements: str
+    default: ['100.125.4.25', '100.125.129.199']
+  port:
+    description: DNS servers port.
+    type: int
+    default: 53
+  timeout:
+    description: Time in seconds to wait for the batch answers.
+    type: float
+    default: 2
+  query_count:
+    description: Count of query batches.
+    type: int
+    default: 30
+  result_verbosity:
+    description: Amount of data returned in module result.
+    type: str
+    default: summary
+    choices: [none, summary, full]
+requirements: []
+'''
+
+RETURN = '''
+pushed_metrics_count:
+  description: Count of metrics pushed into socket
+  type: int
+  returned: When result_verbosity is summary
+  sample: 30
+pushed_metrics:
+  description: List of metrics to be pushed into socket
+  type: complex
+  returned: When result_verbosity is full
+  contains:
+    name:
+      description: Name of metric.
+      type: str
+      sample: "csm_dns_timings.100_125_4_25"
+    timestamp:
+      description: Current timestamp.
+      type: str
+      sample: "2021-02-15T08:57:23.701273"
+    metric_type:
+      description: Type of gathered value ('ms' for milliseconds, 'c' for counter).
+      type: str
+      sample: "ms"
+    value:
+      description: Response time in milliseconds
+      type: int
+      sample: 7
+    __type:
+      description: Message type('metric' is default value).
+      type: str
+      sample: "metric"
+'''
+
+EXAMPLES = '''
+# Resolve record using default OTC internal resolvers
+- dns_resolve_monitoring:
+    record_names:
+      - "dns-monitoring.internal.domain"
+  register: out
+'''
+
+SUCCESS_METRIC = 'csm_dns_timings'
+NXDOMAIN_METRIC = 'csm_dns_nxdomain'
+FAILED_METRIC = 'csm_dns_failed'
+TIMEOUT_METRIC = 'csm_dns_timeout'
+
+DEFAULT_RESOLVERS = ['100.125.4.25', '100.125.129.199']
+
+HEADER_SIZE = 12
+MAX_QUERY_ID = 0xFFFF
+RECV_BUFFER = 4096
+FLAG_QR = 0x8000
+FLAG_RD = 0x0100
+RCODE_MASK = 0x000F
+RCODE_NOERROR = 0
+RCODE_NXDOMAIN = 3
+QTYPE_A = 1
+QCLASS_IN = 1
+
+
+def build_query(query_id, name):
+    """Build DNS query packet for `A` record of the `name`"""
+    header = struct.pack('!HHHHHH', query_id, FLAG_RD, 1, 0, 0, 0)
+    labels = b''.join(
+        bytes([len(label)]) + label.encode('idna')
+        for label in name.rstrip('.').split('.') if label
+    )
+    return header + labels + b'\x00' + struct.pack('!HH', QTYPE_A, QCLASS_IN)
+
+
+def parse_response(packet):
+    """Get query ID and response code from DNS response packet header
+
+    Returns `(None, None)` if packet is not a DNS response
+    """
+    if len(packet) < HEADER_SIZE:
+        return None, None
+    query_id, flags = struct.unpack('!HH', packet[:4])
+    if not flags & FLAG_QR:
+        return None, None
+    return query_id, flags & RCODE_MASK
+
+
+def resolver_label(resolver):
+    """Metric-safe representation of resolver address"""
+    return resolver.replace('.', '_').replace(':', '_')
+
+
+class DnsResolveMonitoring(MessageModule):
+    argument_spec = dict(
+        record_names=dict(type='list', elements='str', required=True),
+        resolvers=dict(type='list', elements='str', default=DEFAULT_RESOLVERS),
+        port=dict(type='int', default=53),
+        timeout=dict(type='float', default=2),
+        query_count=dict(type='int', default=30)
+    )
+
+    @staticmethod
+    def _next_query_id(pending):
+        query_id = random.randint(0, MAX_QUERY_ID)
+        while query_id in pending:
+            query_id = (query_id + 1) & MAX_QUERY_ID
+        return query_id
+
+    def _resolve_resolvers(self):
+        """Get address family and socket address of every resolver
+
+        Resolvers can be set either as IPv4/IPv6 literals or host names
+        """
+        resolved = {}
+        for resolver in self.params['resolvers']:
+            family, _, _, _, address = socket.getaddrinfo(
+                resolver, self.params['port'], type=socket.SOCK_DGRAM)[0]
+            resolved[resolver] = (family, address)
+        return resolved
+
+    def _send_batch(self, sockets, resolved):
+        """Send queries for all records to all resolvers, return pending queries by ID"""
+        pending = {}
+        for resolver, (family, address) in resolved.items():
+            for name in self.params['record_names']:
+                query_id = self._next_query_id(pending)
+                sockets[family].sendto(build_query(query_id, name), address)
+                pending[query_id] = (resolver, name, time.monotonic(), address[0])
+        return pending
+
+    @staticmethod
+    def _collect_batch(sockets, pending, deadline):
+        """Receive answers for pending queries until all answered or deadline reached
+
+        Answered queries are removed from `pending`
+        """
+        answers = []
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            readable, _, _ = select.select(list(sockets.values()), [], [], remaining)
+            if not readable:
+                break
+            for sock in readable:
+                packet, address = sock.recvfrom(RECV_BUFFER)
+                received = time.monotonic()
+                query_id, rcode = parse_response(packet)
+                query = pending.get(query_id)
+                if query is None or query[3] != address[0]:
+                    continue
+                del pending[query_id]
+                answers.append((query, rcode, received))
+        return answers
+
+    def _answer_metrics(self, query, rcode, received):
+        """Answer timing for NOERROR and NXDOMAIN, failure counter for other codes"""
+        resolver, name, sent, _ = query
+        label = resolver_label(resolver)
+        if rcode not in (RCODE_NOERROR, RCODE_NXDOMAIN):
+            self.log(f'{name} is not resolved by {resolver}: rcode {rcode}')
+            return [self.create_metric(
+                name=f'{FAILED_METRIC}.{label}.rcode_{rcode}.failed',
+                value=1,
+                metric_type='c'
+            )]
+        metrics = [self.create_metric(
+            name=f'{SUCCESS_METRIC}.{label}',
+            value=int((received - sent) * 1000),
+            metric_type='ms'
+        )]
+        if rcode == RCODE_NXDOMAIN:
+            self.log(f'{name} is not resolved by {resolver}: NXDOMAIN')
+            metrics.append(self.create_metric(
+                name=f'{NXDOMAIN_METRIC}.{label}.failed',
+                value=1,
+                metric_type='c'
+            ))
+        return metrics
+
+    def _batch_metrics(self, answers, pending):
+        metrics = []
+        for query, rcode, received in answers:
+            metrics.extend(self._answer_metrics(query, rcode, received))
+        for resolver, name, _, _ in pending.values():
+            self.log(f'timeout resolving {name} by {resolver}')
+            metrics.append(self.create_metric(
+                name=f'{TIMEOUT_METRIC}.{resolver_label(resolver)}.failed',
+                value=1,
+                metric_type='c'
+            ))
+        return metrics
+
+    def run(self):
+        metrics = []
+        resolved = self._resolve_resolvers()
+        with contextlib.ExitStack() as stack:
+            sockets = {
+                family: stack.enter_context(socket.socket(family, socket.SOCK_DGRAM))
+                for family, _ in resolved.values()
+            }
+            for _ in range(self.params['query_count']):
+                pending = self._send_batch(sockets, resolved)
+                deadline = time.monotonic() + self.params['timeout']
+                answers = self._collect_batch(sockets, pending, deadline)
+                metrics.extend(self._batch_metrics(answers, pending))
+        if self.params['socket']:
+            for metric in metrics:
+                self.push_metric(metric, self.params['socket'])
+            self.exit_metrics(metrics)
+        self.fail_json(msg='socket must be set')
+
+
+def main():
+    module = DnsResolveMonitoring()
+    module()
+
+
+if __name__ == '__main__':
+    main()
@@ -55,14 +55,24 @@ options:
     type: str
     default: http
     choices=['http', 'https', 'tcp']
+  result_verbosity:
+    description: Amount of data returned in module result.
+    type: str
+    default: summary
+    choices: [none, summary, full]
 requirements: []
 '''
 
 RETURN = '''
+pushed_metrics_count:
+  description: Count of metrics pushed into socket
+  type: int
+  returned: When result_verbosity is summary
+  sample: 30
 pushed_metrics:
   description: List of metrics to be pushed into socket
   type: complex
-  returned: On Success
+  returned: When result_verbosity is full
   contains:
     name:
       description: Name of metric.
@@ -152,7 +162,7 @@ class LbLoadMonitoring(MessageModule):
         if self.params['socket']:
             for metric in metrics:
                 self.push_metric(metric, self.params['socket'])
-            self.exit(changed=True, pushed_metrics=metrics)
+            self.exit_metrics(metrics)
         self.fail_json(msg='socket must be set')
 
 
@@ -0,0 +1,286 @@
+#!/usr/bin/python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import collections
+import io
+import multiprocessing
+import os
+import time
+
+import psycopg2
+import yaml
+from ansible.module_utils.message import MessageModule
+from psycopg2 import sql
+
+DOCUMENTATION = '''
+---
+module: rds_backup_generate_data
+short_description: Generate data in RDS PostgreSQL instance.
+version_added: "1.0.0"
+author: "Anton Sidelnikov (@anton-sidelnikov)"
+description:
+  - Stream generated rows into target table using `COPY FROM STDIN`.
+  - Rows are generated in bounded chunks, optionally by several worker processes.
+  - `record_count` and `max_size_in_bytes` from data source file are hard limits
+    of rows count and total size of the target table including indexes, only missing
+    rows are generated. Table size is checked before every chunk.
+  - Target instance should be reachable from the host running the module.
+  - Generation speed is pushed to unix socket server.
+  - APIMON_PROFILER_MESSAGE_SOCKET environment variable should be set.
+options:
+  host:
+    description: Address of target RDS instance.
+    type: str
+    required: true
+  port:
+    description: Port of target RDS instance.
+    type: int
+    default: 5432
+  database:
+    description: Database name.
+    type: str
+    default: entities
+  username:
+    description: Database user name.
+    type: str
+    required: true
+  password:
+    description: Database user password.
+    type: str
+    required: true
+  source:
+    description: Path to data source file.
+    type: str
+    required: true
+  table:
+    description: Name of the table to be filled, created if missing.
+    type: str
+    default: entity
+  chunk_rows:
+    description: Count of rows generated and streamed at once, should be positive.
+    type: int
+    default: 10000
+  workers:
+    description: Count of processes generating rows.
+    type: int
+    default: 1
+  timeout:
+    description: Connection timeout value.
+    type: int
+    default: 20
+  result_verbosity:
+    description: Amount of data returned in module result.
+    type: str
+    default: summary
+    choices: [none, summary, full]
+requirements: [psycopg2]
+'''
+
+RETURN = '''
+rows:
+  description: Count of rows written.
+  type: int
+  returned: When result_verbosity is summary or full
+  sample: 1024000
+bytes:
+  description: Growth of the table size in bytes, including indexes.
+  type: int
+  returned: When result_verbosity is summary or full
+  sample: 999424000
+pushed_metrics_count:
+  description: Count of metrics pushed into socket
+  type: int
+  returned: When result_verbosity is summary
+  sample: 30
+pushed_metrics:
+  description: List of metrics to be pushed into socket
+  type: complex
+  returned: When result_verbosity is full
+  contains:
+    name:
+      description: Name of metric.
+      type: str
+      sample: "csm_rds_backup_generate.rows"
+    timestamp:
+      description: Current timestamp.
+      type: str
+      sample: "2021-02-15T08:57:23.701273"
+    metric_type:
+      description: Type of gathered value ('g' for gauge).
+      type: str
+      sample: "g"
+    value:
+      description: Generation speed per second
+      type: int
+      sample: 250000
+    __type:
+      description: Message type('metric' is default value).
+      type: str
+      sample: "metric"
+'''
+
+EXAMPLES = '''
+# Fill RDS instance using 4 generating processes
+- rds_backup_generate_data:
+    host: "192.168.0.10"
+    username: "root"
+    password: "secret"
+    source: "files/data_sources/sqla.yaml"
+    workers: 4
+  register: out
+'''
+
+SPEED_METRIC = 'csm_rds_backup_generate'
+
+DEFAULT_SYMBOL_COUNT = 128
+COPY_BUFFER_SIZE = 1024 * 1024
+# Heap tuple header, line pointer, bigserial id and primary key index entry
+ROW_OVERHEAD = 64
+
+
+def remaining_rows(record_count, max_size, footprint, table_rows, table_size):
+    """Count of rows to be added keeping table within `record_count` and `max_size`"""
+    return max(min(record_count - table_rows, int((max_size - table_size) // footprint)), 0)
+
+
+def generate_chunk(rows, symbol_count):
+    """Generate COPY text payload of `rows` random rows `symbol_count` symbols long"""
+    payload = os.urandom((rows * symbol_count + 1) // 2).hex()
+    lines = (payload[i:i + symbol_count] for i in range(0, rows * symbol_count, symbol_count))
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def iter_chunks(chunk_rows, symbol_count, workers):
+    """Endlessly yield generated chunks keeping at most two chunks per worker in memory"""
+    if workers <= 1:
+        while True:
+            yield generate_chunk(chunk_rows, symbol_count)
+    with multiprocessing.Pool(workers) as pool:
+        pending = collections.deque()
+        while True:
+            while len(pending) < workers * 2:
+                pending.append(pool.apply_async(generate_chunk, (chunk_rows, symbol_count)))
+            yield pending.popleft().get()
+
+
+class RdsBackupGenerateData(MessageModule):
+    argument_spec = dict(
+        host=dict(type='str', required=True),
+        port=dict(type='int', default=5432),
+        database=dict(type='str', default='entities'),
+        username=dict(type='str', required=True),
+        password=dict(type='str', required=True, no_log=True),
+        source=dict(type='str', required=True),
+        table=dict(type='str', default='entity'),
+        chunk_rows=dict(type='int', default=10000),
+        workers=dict(type='int', default=1),
+        timeout=dict(type='int', default=20)
+    )
+
+    def _read_source(self):
+        with open(self.params['source']) as src_file:
+            return yaml.safe_load(src_file)
+
+    def _connect(self):
+        return psycopg2.connect(
+            host=self.params['host'],
+            port=self.params['port'],
+            dbname=self.params['database'],
+            user=self.params['username'],
+            password=self.params['password'],
+            connect_timeout=self.params['timeout']
+        )
+
+    @staticmethod
+    def _create_table(cursor, table):
+        cursor.execute(sql.SQL(
+            'CREATE TABLE IF NOT EXISTS {} (id bigserial PRIMARY KEY, content text)'
+        ).format(table))
+
+    @staticmethod
+    def _table_size(cursor, table):
+        """Total size of the table including indexes and TOAST in bytes"""
+        cursor.execute(sql.SQL('SELECT pg_total_relation_size({}::regclass)').format(
+            sql.Literal(table.as_string(cursor))))
+        return cursor.fetchone()[0]
+
+    def _fill(self, cursor, table, source):
+        """Stream rows missing up to data source limits chunk by chunk
+
+        Table size is checked before every chunk and row footprint is taken
+        from the measured table growth, so tuple headers and index entries are
+        counted against `max_size_in_bytes`
+
+        Returns count of written rows and table growth in bytes
+        """
+        symbol_count = source.get('symbol_count', DEFAULT_SYMBOL_COUNT)
+        row_size = symbol_count + 1
+        cursor.execute(sql.SQL('SELECT count(*) FROM {}').format(table))
+        table_rows = cursor.fetchone()[0]
+        initial_size = table_size = self._table_size(cursor, table)
+        footprint = table_size / table_rows if table_rows else row_size + ROW_OVERHEAD
+        written = 0
+        chunks = iter_chunks(self.params['chunk_rows'], symbol_count, self.params['workers'])
+        try:
+            while True:
+                count = min(self.params['chunk_rows'], remaining_rows(
+                    source['record_count'], source['max_size_in_bytes'],
+                    footprint, table_rows + written, table_size
+                ))
+                if not count:
+                    break
+                cursor.copy_expert(
+                    sql.SQL('COPY {} (content) FROM STDIN').format(table),
+                    io.BytesIO(next(chunks)[:count * row_size]),
+                    size=COPY_BUFFER_SIZE
+                )
+                written += count
+                table_size = self._table_size(cursor, table)
+                footprint = max((table_size - initial_size) / written, row_size)
+        finally:
+            chunks.close()
+        return written, table_size - initial_size
+
+    def run(self):
+        if self.params['chunk_rows'] < 1:
+            self.fail_json(msg='chunk_rows must be positive')
+        source = self._read_source()
+
+        started = time.monotonic()
+        table = sql.Identifier(self.params['table'])
+        with self._connect() as connection:
+            with connection.cursor() as cursor:
+                self._create_table(cursor, table)
+                rows, size = self._fill(cursor, table, source)
+        connection.close()
+        elapsed = max(time.monotonic() - started, 1e-6)
+
+        metrics = [
+            self.create_metric(name=f'{SPEED_METRIC}.rows', value=int(rows / elapsed),
+                               metric_type='g'),
+            self.create_metric(name=f'{SPEED_METRIC}.bytes', value=int(size / elapsed),
+                               metric_type='g')
+        ]
+        if self.params['socket']:
+            for metric in metrics:
+                self.push_metric(metric, self.params['socket'])
+            self.exit_metrics(metrics, rows=rows, bytes=size)
+        self.fail_json(msg='socket must be set')
+
+
+def main():
+    module = RdsBackupGenerateData()
+    module()
+
+
+if __name__ == '__main__':
+    main()
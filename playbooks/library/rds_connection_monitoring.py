@@ -0,0 +1,265 @@
+#!/usr/bin/python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+import socket
+import time
+
+import psycopg2
+from ansible.module_utils.message import MessageModule
+
+DOCUMENTATION = '''
+---
+module: rds_connection_monitoring
+short_description: RDS PostgreSQL connectivity and query response times.
+version_added: "1.0.0"
+author: "Anton Sidelnikov (@anton-sidelnikov)"
+description:
+  - Keep small pool of connections to target PostgreSQL instance and probe it
+  - TCP connect, startup with authentication and query latencies are measured
+    separately. TCP connect is timed once per probe, startup with authentication
+    is session establishment time minus TCP connect time.
+  - Slots failing to establish session are not retried, probe stops when
+    instance is not reachable or no sessions are left.
+  - Percentile summaries of every phase are pushed to unix socket server.
+  - APIMON_PROFILER_MESSAGE_SOCKET environment variable should be set.
+options:
+  host:
+    description: Address of target RDS instance.
+    type: str
+    required: true
+  port:
+    description: Port of target RDS instance.
+    type: int
+    default: 5432
+  database:
+    description: Database name.
+    type: str
+    default: postgres
+  username:
+    description: Database user name.
+    type: str
+    required: true
+  password:
+    description: Database user password.
+    type: str
+    required: true
+  timeout:
+    description: Connection timeout value.
+    type: int
+    default: 20
+  pool_size:
+    description: Count of connections kept open during the probe, should be positive.
+    type: int
+    default: 3
+  query_count:
+    description: Count of queries sent over pooled connections.
+    type: int
+    default: 30
+  query:
+    description: Query used for probing.
+    type: str
+    default: SELECT 1
+  result_verbosity:
+    description: Amount of data returned in module result.
+    type: str
+    default: summary
+    choices: [none, summary, full]
+requirements: [psycopg2]
+'''
+
+RETURN = '''
+pushed_metrics_count:
+  description: Count of metrics pushed into socket
+  type: int
+  returned: When result_verbosity is summary
+  sample: 30
+pushed_metrics:
+  description: List of metrics to be pushed into socket
+  type: complex
+  returned: When result_verbosity is full
+  contains:
+    name:
+      description: Name of metric.
+      type: str
+      sample: "csm_rds_timings.query.p95"
+    timestamp:
+      description: Current timestamp.
+      type: str
+      sample: "2021-02-15T08:57:23.701273"
+    metric_type:
+      description: Type of gathered value ('ms' for milliseconds, 'c' for counter).
+      type: str
+      sample: "ms"
+    value:
+      description: Response time in milliseconds
+      type: int
+      sample: 7
+    __type:
+      description: Message type('metric' is default value).
+      type: str
+      sample: "metric"
+'''
+
+EXAMPLES = '''
+# Probe RDS instance using 3 pooled connections
+- rds_connection_monitoring:
+    host: "192.168.0.10"
+    username: "root"
+    password: "secret"
+  register: out
+'''
+
+SUCCESS_METRIC = 'csm_rds_timings'
+FAILED_METRIC = 'csm_rds_failed'
+
+PHASES = ('connect', 'auth', 'query')
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of the sorted `values`"""
+    rank = max(math.ceil(pct / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def elapsed_ms(started):
+    return (time.monotonic() - started) * 1000
+
+
+class RdsConnectionMonitoring(MessageModule):
+    argument_spec = dict(
+        host=dict(type='str', required=True),
+        port=dict(type='int', default=5432),
+        database=dict(type='str', default='postgres'),
+        username=dict(type='str', required=True),
+        password=dict(type='str', required=True, no_log=True),
+        timeout=dict(type='int', default=20),
+        pool_size=dict(type='int', default=3),
+        query_count=dict(type='int', default=30),
+        query=dict(type='str', default='SELECT 1')
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.timings = {phase: [] for phase in PHASES}
+        self.failures = {phase: 0 for phase in PHASES}
+
+    def _probe_tcp(self):
+        """Measure TCP handshake time to the instance, returns `None` on failure"""
+        address = (self.params['host'], self.params['port'])
+        started = time.monotonic()
+        try:
+            with socket.create_connection(address, timeout=self.params['timeout']):
+                connect_ms = elapsed_ms(started)
+        except OSError as err:
+            self.log(f'error connecting to RDS instance: {err}')
+            self.failures['connect'] += 1
+            return None
+        self.timings['connect'].append(connect_ms)
+        return connect_ms
+
+    def _open_connection(self, connect_ms):
+        """Open new pooled connection, returns `None` on failure"""
+        started = time.monotonic()
+        try:
+            connection = psycopg2.connect(
+                host=self.params['host'],
+                port=self.params['port'],
+                dbname=self.params['database'],
+                user=self.params['username'],
+                password=self.params['password'],
+                connect_timeout=self.params['timeout']
+            )
+        except psycopg2.Error as err:
+            self.log(f'error establishing RDS session: {err}')
+            self.failures['auth'] += 1
+            return None
+        self.timings['auth'].append(max(elapsed_ms(started) - connect_ms, 0))
+        connection.autocommit = True
+        return connection
+
+    def _query(self, connection):
+        """Run probe query, returns `False` if connection is broken"""
+        started = time.monotonic()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(self.params['query'])
+                cursor.fetchall()
+        except psycopg2.Error as err:
+            self.log(f'error executing query: {err}')
+            self.failures['query'] += 1
+            return False
+        self.timings['query'].append(elapsed_ms(started))
+        return True
+
+    def _probe(self):
+        connect_ms = self._probe_tcp()
+        if connect_ms is None:
+            return
+        pool = [self._open_connection(connect_ms) for _ in range(self.params['pool_size'])]
+        try:
+            for i in range(self.params['query_count']):
+                live = [slot for slot, connection in enumerate(pool) if connection is not None]
+                if not live:
+                    self.log('no RDS sessions left, stop probing')
+                    break
+                slot = live[i % len(live)]
+                if pool[slot].closed:
+                    pool[slot] = self._open_connection(connect_ms)
+                    if pool[slot] is None:
+                        continue
+                if not self._query(pool[slot]):
+                    pool[slot].close()
+        finally:
+            for connection in pool:
+                if connection is not None:
+                    connection.close()
+
+    def _summary_metrics(self):
+        metrics = []
+        for phase in PHASES:
+            values = sorted(self.timings[phase])
+            if values:
+                for pct in PERCENTILES:
+                    metrics.append(self.create_metric(
+                        name=f'{SUCCESS_METRIC}.{phase}.p{pct}',
+                        value=int(percentile(values, pct)),
+                        metric_type='ms'
+                    ))
+            if self.failures[phase]:
+                metrics.append(self.create_metric(
+                    name=f'{FAILED_METRIC}.{phase}.failed',
+                    value=self.failures[phase],
+                    metric_type='c'
+                ))
+        return metrics
+
+    def run(self):
+        if self.params['pool_size'] < 1:
+            self.fail_json(msg='pool_size must be positive')
+        self._probe()
+        metrics = self._summary_metrics()
+        if self.params['socket']:
+            for metric in metrics:
+                self.push_metric(metric, self.params['socket'])
+            self.exit_metrics(metrics)
+        self.fail_json(msg='socket must be set')
+
+
+def main():
+    module = RdsConnectionMonitoring()
+    module()
+
+
+if __name__ == '__main__':
+    main()
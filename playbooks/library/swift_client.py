@@ -37,6 +37,15 @@ options:
     type: int
     choices=[present, absent, fetch]
     default: present
+  dest:
+    description: Path the fetched object is streamed to instead of returning its content.
+    type: path
+  result_verbosity:
+    description: Amount of data returned in module result, object content and
+      listings are returned only for `full`.
+    type: str
+    default: summary
+    choices: [none, summary, full]
 requirements: []
 '''
 
@@ -66,12 +75,14 @@ EXAMPLES = '''
 - name: Swift list containers
   swift_client:
     state: fetch
+    result_verbosity: full
   register: result
 
 - name: Swift container objects list
   swift_client:
     state: fetch
     container: csm
+    result_verbosity: full
   register: result
 
 - name: Swift container object content
@@ -79,6 +90,15 @@ EXAMPLES = '''
     state: fetch
     container: csm
     object_name: lb_monitoring_inventory
+    result_verbosity: full
+  register: result
+
+- name: Swift download container object to file
+  swift_client:
+    state: fetch
+    container: csm
+    object_name: lb_monitoring_inventory
+    dest: /tmp/lb_monitoring_inventory
   register: result
 
 - name: Swift delete object
@@ -95,13 +115,16 @@ EXAMPLES = '''
   register: result
 '''
 
+CHUNK_SIZE = 1024 * 1024
+
 
 class SwiftClient(SwiftModule):
     argument_spec = dict(
         container=dict(type='str', required=False),
         object_name=dict(type='str', required=False),
         state=dict(required=False, choices=['present', 'absent', 'fetch'], default='present'),
-        content=dict(type='str', required=False)
+        content=dict(type='str', required=False),
+        dest=dict(type='path', required=False)
     )
 
     def present(self, container, object_name=None):
@@ -135,11 +158,12 @@ class SwiftClient(SwiftModule):
             )
             object_data = raw.to_dict()
             object_data.pop('location')
-            object_data['content'] = content
             data['object'] = object_data
             changed = True
+            full = dict(data, object=dict(object_data, content=content))
+            self.exit_result(changed=changed, summary=data, full=full)
 
-        self.exit(changed=changed, **data)
+        self.exit_result(changed=changed, summary=data)
 
     def _container_exist(self, name):
         try:
@@ -170,35 +194,78 @@ class SwiftClient(SwiftModule):
         self.client.delete_container(container=container)
         self.exit(changed=True)
 
+    def _download(self, container, object_name, dest):
+        """Stream object to `dest` file, returns written size"""
+        size = 0
+        with open(dest, 'wb') as file:
+            for chunk in self.client.stream_object(object_name, container,
+                                                   chunk_size=CHUNK_SIZE):
+                file.write(chunk)
+                size += len(chunk)
+        return size
+
+    def fetch_object(self, container, object_name):
+        """Downloads the object
+
+        If `dest` is set, object is streamed to the file, otherwise
+        it is returned in `object.content` for `full` result verbosity
+        and only its size is fetched for `summary`
+        """
+        dest = self.params['dest']
+        if dest:
+            size = self._download(container, object_name, dest)
+            self.exit_result(changed=True, summary=dict(object=dict(dest=dest, size=size)))
+
+        verbosity = self.params['result_verbosity']
+        if verbosity == 'full':
+            content = self.client.download_object(object_name, container)
+            self.exit_result(changed=False, full=dict(object=dict(content=content)))
+        if verbosity == 'summary':
+            metadata = self.client.get_object_metadata(object_name, container)
+            self.exit_result(
+                changed=False,
+                summary=dict(object=dict(size=metadata.content_length))
+            )
+        self.exit_result(changed=False)
+
+    def _list(self, container=None):
+        """Lists objects of the container or all containers
+
+        Resources are only counted for `summary` result verbosity
+        """
+        name = 'objects' if container else 'containers'
+        verbosity = self.params['result_verbosity']
+        if verbosity == 'none':
+            self.exit_result(changed=False)
+        resources = self.client.objects(container) if container else self.client.containers()
+        if verbosity == 'summary':
+            self.exit_result(changed=False, summary={f'{name}_count': sum(1 for _ in resources)})
+
+        items = []
+        for raw in resources:
+            dt = raw.to_dict()
+            dt.pop('location')
+            items.append(dt)
+        self.exit_result(changed=False, full={name: items})
+
     def fetch(self, container=None, object_name=None):
         """Fetches current state
 
-        If container and object name is set, downloads the file
-        returning it in `object.content`
+        If container and object name is set, downloads the object
 
-        If only container is set, list all objects of the container
+        If only container is set, list all objects of the container,
+        only their count is returned for `summary` result verbosity
 
-        If neither are set, list all containers in the project
+        If neither are set, list all containers in the project,
+        only their count is returned for `summary` result verbosity
         """
 
         if container and object_name:
-            content = self.client.download_object(object_name, container)
-            self.exit(changed=False, object=dict(content=content))
+            self.fetch_object(container, object_name)
 
         if container:
-            objects = []
-            for raw in self.client.objects(container):
-                dt = raw.to_dict()
-                dt.pop('location')
-                objects.append(dt)
-            self.exit(changed=False, objects=objects)
-
-        containers = []
-        for raw in self.client.containers():
-            dt = raw.to_dict()
-            dt.pop('location')
-            containers.append(dt)
-        self.exit(changed=False, containers=containers)
+            self._list(container=container)
+        self._list()
 
     def run(self):
         container = self.params['container']
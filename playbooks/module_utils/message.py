@@ -18,17 +18,19 @@ import os
 import socket
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.verbosity import VerbosityMixin, verbosity_argument_spec
 
 
 def message_full_argument_spec(**kwargs):
     spec = dict(
         socket=dict(default=os.getenv("APIMON_PROFILER_MESSAGE_SOCKET", ""))
     )
+    spec.update(verbosity_argument_spec())
     spec.update(kwargs)
     return spec
 
 
-class MessageModule:
+class MessageModule(VerbosityMixin):
     """Openstack Module is a base class for all Message Module classes."""
 
     argument_spec = {}
@@ -62,6 +64,18 @@ class MessageModule:
         if self.ansible._debug or self.ansible._verbosity > 2:
             self.ansible.log(f'[DEBUG] {msg}')
 
+    def exit_metrics(self, metrics, **kwargs):
+        """Exit module reporting pushed metrics according to `result_verbosity`
+
+        Metrics are returned as `pushed_metrics` for `full` level,
+        only their count as `pushed_metrics_count` for `summary` level.
+        """
+        self.exit_result(
+            changed=True,
+            summary=dict(pushed_metrics_count=len(metrics), **kwargs),
+            full=dict(pushed_metrics=metrics, **kwargs)
+        )
+
     @abc.abstractmethod
     def run(self):
         pass
@@ -14,17 +14,18 @@
 import abc
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.verbosity import VerbosityMixin, verbosity_argument_spec
 from openstack.config import OpenStackConfig
 from openstack.connection import Connection
 
 
 def swift_full_argument_spec(**kwargs):
-    spec = dict()
+    spec = verbosity_argument_spec()
     spec.update(kwargs)
     return spec
 
 
-class SwiftModule:
+class SwiftModule(VerbosityMixin):
     """Openstack Module is a base class for all Message Module classes."""
 
     argument_spec = {}
@@ -0,0 +1,43 @@
+#!/usr/bin/python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+RESULT_VERBOSITY = ['none', 'summary', 'full']
+
+
+def verbosity_argument_spec():
+    return dict(
+        result_verbosity=dict(default='summary', choices=RESULT_VERBOSITY)
+    )
+
+
+class VerbosityMixin:
+    """Mixin limiting module result according to `result_verbosity` parameter."""
+
+    def exit_result(self, changed=False, summary=None, full=None):
+        """Exit module with result according to `result_verbosity`
+
+        Only `changed` is returned for `none` level, `summary` data for
+        `summary` level and `full` data (falls back to `summary`) for `full` level.
+
+        Arguments:
+            changed {bool} -- Changed flag.
+            summary {dict} -- Bounded result data.
+            full {dict} -- Complete result data.
+        """
+        verbosity = self.params['result_verbosity']
+        result = {}
+        if verbosity == 'summary' or (verbosity == 'full' and full is None):
+            result = summary or {}
+        elif verbosity == 'full':
+            result = full
+        self.exit(changed=changed, **result)